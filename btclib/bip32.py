@@ -279,8 +279,10 @@ def _ckd(d: XkeyDict, index: bytes) -> None:
         h = hmac.digest(d['chain_code'], d['key'] + index, 'sha512')
         d['chain_code'] = h[32:]
         offset = int.from_bytes(h[:32], byteorder='big')
-        Offset = mult(offset)
-        d['Q'] = ec.add(d['Q'], Offset)
+        # d['Q'] is already known to be on curve: add in Jacobian
+        # coordinates, without validation and with a single mod_inv
+        QJ = ec._add_jac_aff(ec._mult_G(offset), d['Q'])
+        d['Q'] = ec._aff_from_jac(QJ)
         d['key'] = bytes_from_point(d['Q'], True, ec)
         d['q'] = 0
 
@@ -144,7 +144,7 @@ from base64 import b64decode, b64encode
 from hashlib import sha256
 from typing import Optional, Tuple, Union
 
-from . import bip32, dsa
+from . import bip32, dsa, varint
 from .alias import BMSig, Octets, String
 from .base58address import h160_from_b58address, p2pkh, p2wpkh_p2sh
 from .base58wif import prvkeytuple_from_xprvwif
@@ -154,6 +154,8 @@ from .curves import secp256k1
 from .secpoint import bytes_from_point
 from .utils import hash160
 
+_MAGIC_PREFIX = b'\x18Bitcoin Signed Message:\n'
+
 
 def _magic_hash(msg: String) -> bytes:
 
@@ -162,7 +164,7 @@ def _magic_hash(msg: String) -> bytes:
     if isinstance(msg, str):
         msg = msg.encode()
 
-    t = b'\x18Bitcoin Signed Message:\n' + len(msg).to_bytes(1, 'big') + msg
+    t = b''.join((_MAGIC_PREFIX, varint.encode(len(msg)), msg))
     return sha256(t).digest()
 
 
@@ -11,10 +11,10 @@
 """Elliptic curve class."""
 
 from math import sqrt
-from typing import Union
+from typing import List, Union
 
 from .alias import INF, INFJ, JacPoint, Point
-from .numbertheory import legendre_symbol, mod_inv, mod_sqrt
+from .numbertheory import legendre_symbol, mod_inv, mod_inv_batch, mod_sqrt
 
 
 def _jac_from_aff(Q: Point) -> JacPoint:
@@ -22,6 +22,26 @@ def _jac_from_aff(Q: Point) -> JacPoint:
     return Q[0], Q[1], 1 if Q[1] else 0
 
 
+def _wnaf(m: int, w: int) -> List[int]:
+    # width-w Non-Adjacent Form of m > 0, least significant digit first:
+    # non-zero digits are odd and in the (-2^(w-1), 2^(w-1)) range;
+    # at most one of any w consecutive digits is non-zero
+    digits: List[int] = list()
+    mask = (1 << w) - 1
+    half = 1 << (w - 1)
+    while m > 0:
+        if m & 1:
+            d = m & mask
+            if d >= half:
+                d -= 1 << w
+            m -= d
+        else:
+            d = 0
+        digits.append(d)
+        m >>= 1
+    return digits
+
+
 class Curve:
     """Elliptic curve y^2 = x^3 + a*x + b over Fp group."""
 
@@ -61,6 +81,10 @@ class Curve:
         # must be true to break simmetry using quadratic residue
         self.pIsThreeModFour = (p % 4 == 3)
         self._p = p
+        # cached (p-1)/2 and (p+1)/4: Euler criterion and square root
+        # exponents, the latter being used only if p = 3 (mod 4)
+        self._p_half = p >> 1
+        self._p_plus1_div4 = (p + 1) >> 2
 
         # 2. check that a and b are integers in the interval [0, p−1]
         if not 0 <= a < p:
@@ -109,7 +133,7 @@ class Curve:
         # INF = mult(self, n, self.G)
         # as the above would be tautologically true
         InfMinusG = self._mult_aff(n-1, self.G)
-        Infinity = self.add(InfMinusG, self.G)
+        Infinity = self._add_aff(InfMinusG, self.G)
         if Infinity[1] != 0:
             raise ValueError(f"n ({hex(n)}) is not the group order")
 
@@ -122,6 +146,19 @@ class Curve:
                 if pow(p, i, n) == 1:
                     raise UserWarning("weak curve")
 
+        # odd multiples of G (G, 3G, 5G, ..., 15G), and their opposites,
+        # used by the width-5 wNAF double multiplication
+        # (curvemult._odd_mults and _double_mult)
+        G2 = self._dbl_aff(self.G)
+        self._G_odd_mults = [self.G]
+        for _ in range(7):
+            self._G_odd_mults.append(self._add_aff(self._G_odd_mults[-1], G2))
+        self._G_odd_mults_opp = [(Q[0], (p - Q[1]) % p)
+                                 for Q in self._G_odd_mults]
+        # fixed-base window tables for _mult_G, built on first use
+        self._G_table: List[List[Point]] = []
+        self._G_table_opp: List[List[Point]] = []
+
     def __str__(self) -> str:
         result = "Curve"
         result += f"\n p   = {hex(self._p).upper()}"
@@ -148,29 +185,124 @@ class Curve:
     # moreover, it might be convenient to provide the Curve class with a basic
     # multiplication method, implementing more advanced ones as functions
     def mult(self, m: int, Q: Point = None) -> Point:
-        """Point multiplication, implemented using 'double and add'.
+        """Point multiplication, in Jacobian coordinates.
 
-        Computations use affine coordinates and binary decomposition of m.
+        Multiples of the generator use precomputed fixed-base tables,
+        other points use 'double and add' with mixed addition.
         """
-        if Q is None:
-            Q = self.G
+        # no need to validate the generator
+        if Q is None or Q == self.G:
+            R = self._mult_G(m)
         else:
             self.require_on_curve(Q)
-        return self._mult_aff(m, Q)
+            R = self._mult_jac(m, _jac_from_aff(Q))
+        # a single mod_inv is required, when going back to affine
+        return self._aff_from_jac(R)
 
     def _mult_aff(self, m: int, Q: Point) -> Point:
         # double & add in affine coordinates, using binary decomposition of m
         # Point is assumed to be on curve
+        # one mod_inv for each step: only used in the constructor
+        # for the group order check, as it does not depend on _add_jac
+        # on set bits the add and the double share a single mod_inv
+        # (Montgomery's simultaneous inversion trick)
 
-        m %= self.n
+        if not 0 <= m < self.n:          # skip the division if not needed
+            m %= self.n
         if m == 0 or Q[1] == 0:          # Infinity point, affine coordinates
             return INF                   # return Infinity point
+        p = self._p
+        add = self._add_aff              # avoid attribute lookups per bit
+        dbl = self._dbl_aff
         R = INF                          # initialize as infinity point
-        while m > 0:                     # use binary representation of m
-            if m & 1:                    # if least significant bit is 1
-                R = self._add_aff(R, Q)  # then add current Q
+        while m > 1:                     # use binary representation of m
+            if m & 1 and R[1] != 0 and Q[1] != 0 and R[0] != Q[0]:
+                # fused R = R + Q and Q = 2Q
+                QX, QY = Q
+                RX, RY = R
+                d1 = RX - QX             # add denominator
+                d2 = 2*QY                # double denominator
+                inv = mod_inv(d1*d2, p)
+                lam = ((RY-QY) * inv * d2) % p
+                x = (lam*lam - QX - RX) % p
+                R = x, (lam*(QX - x) - QY) % p
+                lam = ((3*QX*QX + self._a) * inv * d1) % p
+                x = (lam*lam - 2*QX) % p
+                Q = x, (lam*(QX - x) - QY) % p
+            else:
+                if m & 1:                # if least significant bit is 1
+                    R = add(R, Q)        # then add current Q
+                Q = dbl(Q)               # double Q for next step
             m = m >> 1                   # remove the bit just accounted for
-            Q = self._add_aff(Q, Q)      # double Q for next step
+        # most significant bit: no need to double Q any further
+        return add(R, Q)
+
+    def _mult_jac(self, m: int, Q: JacPoint) -> JacPoint:
+        # double & add in Jacobian coordinates, using binary decomposition of m
+        # Point is assumed to be on curve
+
+        if not 0 <= m < self.n:          # skip the division if not needed
+            m %= self.n
+        if m == 0 or Q[2] == 0:          # Infinity point, Jacobian coordinates
+            return INFJ                  # return Infinity point
+        # Q affine coordinates allow for the cheaper mixed addition
+        Qaff = (Q[0], Q[1]) if Q[2] == 1 else self._aff_from_jac(Q)
+        dbl = self._dbl_jac              # avoid attribute lookups per bit
+        add = self._add_jac_aff
+        R = Qaff[0], Qaff[1], 1          # the most significant bit is 1
+        for i in range(m.bit_length() - 2, -1, -1):  # left-to-right
+            R = dbl(R)                   # double for each bit
+            if (m >> i) & 1:             # if the current bit is 1
+                R = add(R, Qaff)         # then add Q
+        return R
+
+    def _build_G_table(self) -> None:
+        # T[i][j-1] = j * 2^(5i) * G, for j in [1, 16],
+        # with enough rows for the nlen+1 bits of a signed recoding
+        p = self._p
+        T: List[List[Point]] = []
+        B = self.G
+        for _ in range(self.nlen // 5 + 1):
+            row = [_jac_from_aff(B)]
+            for _ in range(15):
+                row.append(self._add_jac_aff(row[-1], B))
+            affrow = self._aff_from_jac_batch(row)
+            T.append(affrow)
+            B = self._dbl_aff(affrow[-1])  # 32 * 2^(5i) * G
+        self._G_table_opp = [[(Q[0], (p - Q[1]) % p) for Q in row]
+                             for row in T]
+        self._G_table = T
+
+    def _mult_G(self, m: int) -> JacPoint:
+        # fixed-base multiplication m*G in Jacobian coordinates:
+        # m is recoded in base 32 with signed digits in [-15, 16]
+        # and each digit selects a precomputed point of its own row,
+        # so that no doubling is needed at all;
+        # secret scalars (private keys, nonces) use it too: table lookups
+        # depend on m, as btclib does not aim at side-channel resistance
+
+        if not 0 <= m < self.n:          # skip the division if not needed
+            m %= self.n
+        if m == 0:
+            return INFJ
+        if not self._G_table:
+            self._build_G_table()
+        T = self._G_table
+        T_opp = self._G_table_opp
+        add = self._add_jac_aff
+        R = INFJ
+        i = 0
+        while m:
+            d = m & 31
+            m >>= 5
+            if d > 16:
+                d -= 32
+                m += 1
+            if d > 0:
+                R = add(R, T[i][d-1])
+            elif d < 0:
+                R = add(R, T_opp[i][-d-1])
+            i += 1
         return R
 
     # methods using _p: they would become functions if _p goes public
@@ -190,11 +322,30 @@ class Curve:
         if Q[2] == 0:  # Infinity point in Jacobian coordinates
             return INF
         else:
-            Z2 = Q[2]*Q[2]
-            x = (Q[0]*mod_inv(Z2, self._p)) % self._p
-            y = (Q[1]*mod_inv(Z2*Q[2], self._p)) % self._p
+            # a single mod_inv: 1/Z^2 and 1/Z^3 from 1/Z
+            p = self._p
+            QX, QY, QZ = Q
+            Zinv = mod_inv(QZ, p)
+            Zinv2 = Zinv*Zinv
+            x = (QX*Zinv2) % p
+            y = (QY*Zinv2*Zinv) % p
             return x, y
 
+    def _aff_from_jac_batch(self, Qs: List[JacPoint]) -> List[Point]:
+        # points are assumed to be on curve
+        # a single mod_inv for all the points (Montgomery's trick)
+        p = self._p
+        Zinvs = iter(mod_inv_batch([Q[2] for Q in Qs if Q[2]], p))
+        result: List[Point] = []
+        for X, Y, Z in Qs:
+            if Z == 0:  # Infinity point in Jacobian coordinates
+                result.append(INF)
+            else:
+                Zinv = next(Zinvs)
+                Zinv2 = Zinv*Zinv
+                result.append((X*Zinv2 % p, Y*Zinv2*Zinv % p))
+        return result
+
     def _x_aff_from_jac(self, Q: JacPoint) -> int:
         # point is assumed to be on curve
         if Q[2] == 0:  # Infinity point in Jacobian coordinates
@@ -225,38 +376,85 @@ class Curve:
         if R[2] == 0:  # Infinity point in Jacobian coordinates
             return Q
 
-        RZ2 = R[2] * R[2]
-        RZ3 = RZ2 * R[2]
-        QZ2 = Q[2] * Q[2]
-        QZ3 = QZ2 * Q[2]
-        if Q[0]*RZ2 % self._p == R[0]*QZ2 % self._p:      # same affine x
-            if Q[1]*RZ3 % self._p == R[1]*QZ3 % self._p:  # point doubling
-                QY2 = Q[1]*Q[1]
-                W = (3*Q[0]*Q[0] + self._a*QZ2*QZ2) % self._p
-                V = (4*Q[0]*QY2) % self._p
-                X = (W*W - 2*V) % self._p
-                Y = (W*(V - X) - 8*QY2*QY2) % self._p
-                Z = (2*Q[1]*Q[2]) % self._p
-                return X, Y, Z
-            else:                                         # opposite points
+        p = self._p
+        QX, QY, QZ = Q
+        RX, RY, RZ = R
+        RZ2 = RZ * RZ
+        RZ3 = RZ2 * RZ
+        QZ2 = QZ * QZ
+        QZ3 = QZ2 * QZ
+        M = (QX*RZ2) % p
+        N = (RX*QZ2) % p
+        T = (QY*RZ3) % p
+        U = (RY*QZ3) % p
+        if M == N:                       # same affine x
+            if T == U:                   # point doubling
+                return self._dbl_jac(Q)
+            else:                        # opposite points
                 return INFJ
         else:
-            T = (Q[1]*RZ3) % self._p
-            U = (R[1]*QZ3) % self._p
-            W = (U - T) % self._p
-
-            M = (Q[0]*RZ2) % self._p
-            N = (R[0]*QZ2) % self._p
-            V = (N - M) % self._p
+            W = (U - T) % p
+            V = (N - M) % p
 
             V2 = V * V
             V3 = V2 * V
             MV2 = M * V2
-            X = (W*W - V3 - 2*MV2) % self._p
-            Y = (W*(MV2 - X) - T*V3) % self._p
-            Z = (V*Q[2]*R[2]) % self._p
+            X = (W*W - V3 - 2*MV2) % p
+            Y = (W*(MV2 - X) - T*V3) % p
+            Z = (V*QZ*RZ) % p
             return X, Y, Z
 
+    def _add_jac_aff(self, Q: JacPoint, R: Point) -> JacPoint:
+        # mixed addition, with R in affine coordinates (i.e. Z=1):
+        # madd-2007-bl formula from the Explicit-Formulas Database
+        # https://hyperelliptic.org/EFD/g1p/auto-shortw-jacobian.html
+        # points are assumed to be on curve
+
+        if R[1] == 0:  # Infinity point in affine coordinates
+            return Q
+        if Q[2] == 0:  # Infinity point in Jacobian coordinates
+            return R[0], R[1], 1
+
+        p = self._p
+        QX, QY, QZ = Q
+        RX, RY = R
+        QZ2 = QZ * QZ
+        H = (RX*QZ2 - QX) % p
+        W = 2*(RY*QZ2*QZ - QY) % p
+        if H == 0:                       # same affine x
+            if W == 0:                   # point doubling
+                return self._dbl_jac(Q)
+            else:                        # opposite points
+                return INFJ
+
+        I = 4*H*H
+        J = H*I
+        V = QX*I
+        X = (W*W - J - 2*V) % p
+        Y = (W*(V - X) - 2*QY*J) % p
+        Z = (2*QZ*H) % p
+        return X, Y, Z
+
+    def _dbl_jac(self, Q: JacPoint) -> JacPoint:
+        # point is assumed to be on curve
+
+        if Q[2] == 0:  # Infinity point in Jacobian coordinates
+            return INFJ
+
+        p = self._p
+        QX, QY, QZ = Q
+        QY2 = QY*QY % p
+        if self._a == 0:  # e.g. secp256k1: a*Z^4 vanishes
+            W = (3*QX*QX) % p
+        else:
+            QZ2 = QZ*QZ
+            W = (3*QX*QX + self._a*QZ2*QZ2) % p
+        V = (4*QX*QY2) % p
+        X = (W*W - 2*V) % p
+        Y = (W*(V - X) - 8*QY2*QY2) % p
+        Z = (2*QY*QZ) % p
+        return X, Y, Z
+
     def _add_aff(self, Q: Point, R: Point) -> Point:
         # points are assumed to be on curve
         if R[1] == 0:  # Infinity point in affine coordinates
@@ -264,16 +462,29 @@ class Curve:
         if Q[1] == 0:  # Infinity point in affine coordinates
             return R
 
-        if R[0] == Q[0]:
-            if R[1] == Q[1]:  # point doubling
-                lam = (3 * Q[0] * Q[0] + self._a) * mod_inv(2 * Q[1], self._p)
-                lam %= self._p
-            else:             # opposite points
+        QX, QY = Q
+        RX, RY = R
+        if RX == QX:
+            if RY == QY:  # point doubling
+                return self._dbl_aff(Q)
+            else:         # opposite points
                 return INF
-        else:
-            lam = ((R[1]-Q[1]) * mod_inv(R[0]-Q[0], self._p)) % self._p
-        x = (lam * lam - Q[0] - R[0]) % self._p
-        y = (lam * (Q[0] - x) - Q[1]) % self._p
+        p = self._p
+        lam = ((RY-QY) * mod_inv(RX-QX, p)) % p
+        x = (lam * lam - QX - RX) % p
+        y = (lam * (QX - x) - QY) % p
+        return x, y
+
+    def _dbl_aff(self, Q: Point) -> Point:
+        # point is assumed to be on curve
+        if Q[1] == 0:  # Infinity point in affine coordinates
+            return INF
+
+        p = self._p
+        QX, QY = Q
+        lam = ((3*QX*QX + self._a) * mod_inv(2*QY, p)) % p
+        x = (lam*lam - 2*QX) % p
+        y = (lam*(QX - x) - QY) % p
         return x, y
 
     def _y2(self, x: int) -> int:
@@ -287,6 +498,12 @@ class Curve:
         if not 0 <= x < self._p:
             raise ValueError(f"x-coordinate {hex(x)} not in [0, p-1]")
         y2 = self._y2(x)
+        if self.pIsThreeModFour:  # secp256k1 case
+            # exponent (p+1)//4 is precomputed at construction time
+            y = pow(y2, self._p_plus1_div4, self._p)
+            if y * y % self._p == y2:
+                return y
+            raise ValueError(f"{hex(y2)} has no root (mod {hex(self._p)})")
         # mod_sqrt will raise a ValueError if root does not exist
         return mod_sqrt(y2, self._p)
 
@@ -319,10 +536,11 @@ class Curve:
 
     def has_square_y(self, Q: Union[Point, JacPoint]) -> bool:
         """Return True if the affine y-coordinate is a square."""
+        # Euler criterion, as in legendre_symbol
         if len(Q) == 2:
-            return legendre_symbol(Q[1], self._p) == 1
+            return pow(Q[1], self._p_half, self._p) == 1
         if len(Q) == 3:
-            return legendre_symbol(Q[1]*Q[2] % self._p, self._p) == 1
+            return pow(Q[1]*Q[2], self._p_half, self._p) == 1
         raise ValueError(f"Not a Point")
 
     def require_p_ThreeModFour(self) -> None:
@@ -350,7 +568,7 @@ class Curve:
             raise ValueError("low1high0 must be bool or 1/0")
         root = self.y(x)
         # switch low/high root as needed (XORing the conditions)
-        return root if (self._p//2 >= root) == low1high0 else self._p - root
+        return root if (self._p_half >= root) == low1high0 else self._p - root
 
     def y_quadratic_residue(self, x: int, quad_res: int = 1) -> int:
         """Return the quadratic residue affine y-coordinate."""
@@ -11,42 +11,32 @@
 """Elliptic curve point multiplication functions."""
 
 import heapq
-from typing import List, Sequence
+from typing import List, Sequence, Tuple
 
 from .alias import INFJ, JacPoint, Point
-from .curve import Curve, _jac_from_aff
+from .curve import Curve, _jac_from_aff, _wnaf
 from .curves import secp256k1
 
 
 def mult(m: int, Q: Point = None, ec: Curve = secp256k1) -> Point:
-    """Point multiplication, implemented using 'double and add'.
+    """Point multiplication, in Jacobian coordinates.
 
-    Computations use Jacobian coordinates and binary decomposition of m.
+    Multiples of the generator use precomputed fixed-base tables,
+    other points use 'double and add' with mixed addition.
     """
-    if Q is None:
-        QJ = ec.GJ
+    # no need to validate the generator
+    if Q is None or Q == ec.G:
+        R = ec._mult_G(m)
     else:
         ec.require_on_curve(Q)
-        QJ = _jac_from_aff(Q)
-
-    R = _mult_jac(m, QJ, ec)
+        R = _mult_jac(m, _jac_from_aff(Q), ec)
     return ec._aff_from_jac(R)
 
 
 def _mult_jac(m: int, Q: JacPoint, ec: Curve) -> JacPoint:
     # double & add in Jacobian coordinates, using binary decomposition of m
     # Point is assumed to be on curve
-
-    m %= ec.n
-    if m == 0 or Q[2] == 0:        # Infinity point in affine coordinates
-        return INFJ                # return Infinity point
-    R = INFJ                       # initialize as infinity point
-    while m > 0:                   # use binary representation of m
-        if m & 1:                  # if least significant bit is 1
-            R = ec._add_jac(R, Q)  # then add current Q
-        m = m >> 1                 # remove the bit just accounted for
-        Q = ec._add_jac(Q, Q)      # double Q for next step
-    return R
+    return ec._mult_jac(m, Q)
 
 
 def double_mult(u: int, H: Point, v: int, Q: Point = None,
@@ -67,29 +57,58 @@ def double_mult(u: int, H: Point, v: int, Q: Point = None,
     return ec._aff_from_jac(R)
 
 
+def _odd_mults(QJ: JacPoint, ec: Curve) -> Tuple[List[Point], List[Point]]:
+    # affine Q, 3Q, ..., 15Q and their opposites, for width-5 wNAF
+    if QJ == ec.GJ:
+        return ec._G_odd_mults, ec._G_odd_mults_opp
+    Q = (QJ[0], QJ[1]) if QJ[2] == 1 else ec._aff_from_jac(QJ)
+    Q2 = ec._dbl_aff(Q)
+    T = [QJ]
+    for _ in range(7):
+        T.append(ec._add_jac_aff(T[-1], Q2))
+    T = ec._aff_from_jac_batch(T)
+    p = ec._p
+    return T, [(P[0], (p - P[1]) % p) for P in T]
+
+
 def _double_mult(u: int, HJ: JacPoint, v: int, QJ: JacPoint,
                  ec: Curve) -> JacPoint:
 
-    u %= ec.n
+    if not 0 <= u < ec.n:  # skip the division if not needed
+        u %= ec.n
     if u == 0 or HJ[2] == 0:
         return _mult_jac(v, QJ, ec)
 
-    v %= ec.n
+    if not 0 <= v < ec.n:
+        v %= ec.n
     if v == 0 or QJ[2] == 0:
         return _mult_jac(u, HJ, ec)
 
+    # interleaved width-5 wNAF: the doublings are shared,
+    # and each scalar needs an addition about every six bits only
+    TH, TH_opp = _odd_mults(HJ, ec)
+    TQ, TQ_opp = _odd_mults(QJ, ec)
+    wu = _wnaf(u, 5)
+    wv = _wnaf(v, 5)
+    msd = max(len(wu), len(wv))
+    wu += [0] * (msd - len(wu))
+    wv += [0] * (msd - len(wv))
+
+    dbl = ec._dbl_jac
+    add = ec._add_jac_aff
     R = INFJ  # initialize as infinity point
-    msb = max(u.bit_length(), v.bit_length())
-    while msb > 0:
-        if u >> (msb - 1):  # checking msb
-            R = ec._add_jac(R, HJ)
-            u -= pow(2, u.bit_length() - 1)
-        if v >> (msb - 1):  # checking msb
-            R = ec._add_jac(R, QJ)
-            v -= pow(2, v.bit_length() - 1)
-        if msb > 1:
-            R = ec._add_jac(R, R)
-        msb -= 1
+    for i in range(msd - 1, -1, -1):  # left-to-right
+        R = dbl(R)
+        d = wu[i]
+        if d > 0:
+            R = add(R, TH[d >> 1])
+        elif d < 0:
+            R = add(R, TH_opp[-d >> 1])
+        d = wv[i]
+        if d > 0:
+            R = add(R, TQ[d >> 1])
+        elif d < 0:
+            R = add(R, TQ_opp[-d >> 1])
 
     return R
 
@@ -18,14 +18,14 @@
 """
 
 from hashlib import sha256
-from typing import List, Optional, Tuple, Union
+from typing import List, Optional, Sequence, Tuple, Union
 
 from . import bip32, der
 from .alias import DSASig, HashF, JacPoint, Point, PrvKey, PubKey, String
 from .curve import Curve
 from .curvemult import _double_mult, _mult_jac
 from .curves import secp256k1
-from .numbertheory import mod_inv
+from .numbertheory import mod_inv, mod_inv_batch
 from .rfc6979 import _rfc6979
 from .to_prvkey import to_prvkey_int
 from .to_pubkey import to_pubkey_tuple
@@ -87,24 +87,25 @@ def _sign(c: int, q: int, k: int, ec: Curve) -> Tuple[int, int]:
 
     # Steps numbering follows SEC 1 v.2 section 4.1.3
 
-    KJ = _mult_jac(k, ec.GJ, ec)                  # 1
+    KJ = ec._mult_G(k)                            # 1
 
+    n = ec.n
     # affine x-coordinate of K (field element)
-    K_x = (KJ[0]*mod_inv(KJ[2]*KJ[2], ec._p)) % ec._p
+    K_x = ec._x_aff_from_jac(KJ)
     # mod n makes it a scalar
-    r = K_x % ec.n                                # 2, 3
+    r = K_x % n                                   # 2, 3
     if r == 0:  # r≠0 required as it multiplies the public key
         raise ValueError("r = 0, failed to sign")
 
-    s = mod_inv(k, ec.n) * (c + r*q) % ec.n       # 6
+    s = mod_inv(k, n) * (c + r*q) % n             # 6
     if s == 0:  # s≠0 required as verify will need the inverse of s
         raise ValueError("s = 0, failed to sign")
 
     # bitcoin canonical 'low-s' encoding for ECDSA signatures
     # it removes signature malleability as cause of transaction malleability
     # see https://github.com/bitcoin/bitcoin/pull/6769
-    if s > ec.n / 2:
-        s = ec.n - s  # s = - s % ec.n
+    if s > n >> 1:  # integer shift, not float division
+        s = n - s  # s = - s % n
 
     return r, s
 
@@ -142,6 +143,13 @@ def _verhlp(c: int, QJ: JacPoint, r: int, s: int, ec: Curve) -> None:
     # Private function for test/dev purposes
 
     w = mod_inv(s, ec.n)
+    _verhlp_w(c, QJ, r, w, ec)
+
+
+def _verhlp_w(c: int, QJ: JacPoint, r: int, w: int, ec: Curve) -> None:
+    # Private function for test/dev purposes
+    # w is the inverse of s (mod n), possibly from a batch inversion
+
     u = c*w
     v = r*w                                      # 4
     # Let K = u*G + v*Q.
@@ -151,12 +159,66 @@ def _verhlp(c: int, QJ: JacPoint, r: int, s: int, ec: Curve) -> None:
     assert KJ[2] != 0, "how did you do that?!?"  # 5
 
     # affine x-coordinate of K
-    K_x = (KJ[0]*mod_inv(KJ[2]*KJ[2], ec._p)) % ec._p
+    K_x = ec._x_aff_from_jac(KJ)
     x = K_x % ec.n                               # 6, 7
     # Fail if r ≠ K_x %n.
     assert r == x, "Signature verification failed"  # 8
 
 
+def batch_verify(ms: Sequence[String], Qs: Sequence[PubKey],
+                 sigs: Sequence[DSASig],
+                 ec: Curve = secp256k1, hf: HashF = sha256) -> bool:
+    """Batch verification of ECDSA signatures."""
+
+    # try/except wrapper for the Errors raised by _batch_verify
+    try:
+        _batch_verify(ms, Qs, sigs, ec, hf)
+    except Exception:
+        return False
+    else:
+        return True
+
+
+def _batch_verify(ms: Sequence[String], Qs: Sequence[PubKey],
+                  sigs: Sequence[DSASig], ec: Curve, hf: HashF) -> None:
+    # Private function for test/dev purposes
+    # It raises Errors, while batch_verify should always return True or False
+
+    # ECDSA has no algebraic batch verification
+    # (r is just the x-coordinate of K, not the point K itself):
+    # signatures are verified one by one,
+    # but with a single mod_inv for all the s inverses (Montgomery's trick)
+
+    batch_size = len(Qs)
+    if len(ms) != batch_size:
+        errMsg = f"mismatch between number of pubkeys ({batch_size}) "
+        errMsg += f"and number of messages ({len(ms)})"
+        raise ValueError(errMsg)
+    if len(sigs) != batch_size:
+        errMsg = f"mismatch between number of pubkeys ({batch_size}) "
+        errMsg += f"and number of signatures ({len(sigs)})"
+        raise ValueError(errMsg)
+
+    if batch_size < 2:
+        return _verify(ms[0], Qs[0], sigs[0], ec, hf)
+
+    cs: List[int] = list()
+    QJs: List[JacPoint] = list()
+    rs: List[int] = list()
+    ss: List[int] = list()
+    for m, Q, sig in zip(ms, Qs, sigs):
+        r, s = _to_sig(sig, ec)
+        rs.append(r)
+        ss.append(s)
+        cs.append(_challenge(m, ec, hf))
+        Q = to_pubkey_tuple(Q, ec)
+        QJs.append((Q[0], Q[1], 1 if Q[1] else 0))
+
+    ws = mod_inv_batch(ss, ec.n)
+    for c, QJ, r, w in zip(cs, QJs, rs, ws):
+        _verhlp_w(c, QJ, r, w, ec)
+
+
 def recover_pubkeys(msg: String, sig: DSASig,
                     ec: Curve = secp256k1, hf: HashF = sha256) -> List[Point]:
     """ECDSA public key recovery (SEC 1 v.2 section 4.1.6).
@@ -180,39 +242,54 @@ def _recover_pubkeys(c: int, r: int, s: int, ec: Curve) -> List[JacPoint]:
     r1 = mod_inv(r, ec.n)
     r1s = r1*s
     r1e = -r1*c
+    # shared by all the candidate keys
+    r1eGJ = ec._mult_G(r1e)
     keys: List[JacPoint] = list()
     # r = K[0] % ec.n
     # if ec.n < K[0] < ec._p (likely when cofactor ec.h > 1)
     # then both x=r and x=r+ec.n must be tested
     for j in range(ec.h):                                # 1
         # affine x-coordinate of K (field element)
-        x = (r + j*ec.n) % ec._p                         # 1.1
+        x = r + j*ec.n                                   # 1.1
+        if x >= ec._p:  # not a field element: no more candidates
+            break
         # two possible y-coordinates, i.e. two possible keys for each cycle
         try:
             # even root first for bitcoin message signing compatibility
             yodd = ec.y_odd(x, False)
             KJ = x, yodd, 1                              # 1.2, 1.3, and 1.4
             # 1.5 has been performed in the recover_pubkeys calling function
-            Q1J = _double_mult(r1s, KJ, r1e, ec.GJ, ec)  # 1.6.1
-            try:
-                _verhlp(c, Q1J, r, s, ec)                # 1.6.2
-            except Exception:
-                pass
-            else:
-                keys.append(Q1J)                         # 1.6.2
-            KJ = x, ec._p - yodd, 1                      # 1.6.3
-            Q2J = _double_mult(r1s, KJ, r1e, ec.GJ, ec)
-            try:
-                _verhlp(c, Q2J, r, s, ec)                # 1.6.2
-            except Exception:
-                pass
-            else:
-                keys.append(Q2J)                         # 1.6.2
+            # r1s*K for the opposite K is just the opposite point
+            r1sKJ = _mult_jac(r1s, KJ, ec)
+            Q1J = ec._add_jac(r1sKJ, r1eGJ)              # 1.6.1
+            if _is_recovered_key(c, Q1J, r, s, ec):      # 1.6.2
+                keys.append(Q1J)
+            r1sKJ = r1sKJ[0], ec._p - r1sKJ[1], r1sKJ[2]  # 1.6.3
+            Q2J = ec._add_jac(r1sKJ, r1eGJ)
+            if _is_recovered_key(c, Q2J, r, s, ec):      # 1.6.2
+                keys.append(Q2J)
         except Exception:  # K is not a curve point
             pass
     return keys
 
 
+def _is_recovered_key(c: int, QJ: JacPoint, r: int, s: int, ec: Curve) -> bool:
+    # Q = r^-1 (s*K - c*G) satisfies (c*G + r*Q)/s = K by construction
+    # and K_x = r + j*n has already been checked to be a field element,
+    # so the 1.6.2 verification is redundant when K is in the subgroup
+    # of order n, as it is always the case for curves with cofactor 1;
+    # only the infinity point must still be discarded
+    if QJ[2] == 0:
+        return False
+    if ec.h == 1:
+        return True
+    try:
+        _verhlp(c, QJ, r, s, ec)
+    except Exception:
+        return False
+    return True
+
+
 def _recover_pubkey(key_id: int, c: int, r: int, s: int, ec: Curve) -> JacPoint:
     # Private function provided for testing purposes only.
 
@@ -223,8 +300,10 @@ def _recover_pubkey(key_id: int, c: int, r: int, s: int, ec: Curve) -> JacPoint:
     # r = K[0] % ec.n
     # if ec.n < K[0] < ec._p (likely when cofactor ec.h > 1)
     # then both x=r and x=r+ec.n must be tested
-    j = key_id & 0b110  # allow for key_id in [0, 7]
-    x = (r + j*ec.n) % ec._p                         # 1.1
+    j = key_id >> 1  # allow for key_id in [0, 7]
+    x = r + j*ec.n                                   # 1.1
+    if x >= ec._p:
+        raise ValueError(f"Invalid key_id ({key_id}) for r ({hex(r)})")
 
     # even root first for Bitcoin Core compatibility
     i = key_id & 0b01
@@ -232,7 +311,11 @@ def _recover_pubkey(key_id: int, c: int, r: int, s: int, ec: Curve) -> JacPoint:
     KJ = x, y, 1                                     # 1.2, 1.3, and 1.4
     # 1.5 has been performed in the recover_pubkeys calling function
     QJ = _double_mult(r1s, KJ, r1e, ec.GJ, ec)       # 1.6.1
-    _verhlp(c, QJ, r, s, ec)                         # 1.6.2
+    # see _is_recovered_key
+    if QJ[2] == 0:
+        raise ValueError("Invalid recovered public key: INF")
+    if ec.h > 1:
+        _verhlp(c, QJ, r, s, ec)                     # 1.6.2
     return QJ
 
 
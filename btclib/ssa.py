@@ -56,7 +56,7 @@ from typing import List, Sequence, Tuple, Union
 from .alias import HashF, JacPoint, Octets, Point, SSASig
 from .bip32 import XkeyDict
 from .curve import Curve
-from .curvemult import _double_mult, _mult_jac, _multi_mult
+from .curvemult import _double_mult, _multi_mult
 from .curves import secp256k1
 from .numbertheory import mod_inv
 from .to_prvkey import to_prvkey_int
@@ -170,7 +170,7 @@ def pubkey_gen(prvkey: BIP340Key, ec: Curve = secp256k1) -> bytes:
     ec.require_p_ThreeModFour()
 
     q = to_prvkey_int(prvkey, ec)
-    QJ = _mult_jac(q, ec.GJ, ec)
+    QJ = ec._mult_G(q)
     x = ec._x_aff_from_jac(QJ)
     return x.to_bytes(ec.psize, byteorder="big")
 
@@ -215,7 +215,7 @@ def sign(m: Octets, prvkey: BIP340Key, k: BIP340Key = None,
 
     # The secret key d: an integer in the range 1..n-1.
     q = to_prvkey_int(prvkey, ec)
-    QJ = _mult_jac(q, ec.GJ, ec)
+    QJ = ec._mult_G(q)
     x_Q = ec._x_aff_from_jac(QJ)
     if not ec.has_square_y(QJ):
         q = ec.n - q
@@ -227,7 +227,7 @@ def sign(m: Octets, prvkey: BIP340Key, k: BIP340Key = None,
         k = to_prvkey_int(k, ec)
 
     # Let K = kG
-    KJ = _mult_jac(k, ec.GJ, ec)
+    KJ = ec._mult_G(k)
     x_K = ec._x_aff_from_jac(KJ)
     # Let k = k' if jacobi(y_K) = 1, otherwise let k = n - k'.
     if not ec.has_square_y(KJ):
@@ -379,7 +379,7 @@ def _batch_verify(ms: Sequence[Octets], Qs: Sequence[BIP340Key],
         points.append(QJ)
         t += a * s
 
-    TJ = _mult_jac(t, ec.GJ, ec)
+    TJ = ec._mult_G(t)
     RHSJ = _multi_mult(scalars, points, ec)
 
     # return T == RHS, checked in Jacobian coordinates
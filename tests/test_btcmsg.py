@@ -22,6 +22,27 @@ from btclib.utils import bytes_from_octets, sha256
 
 
 class TestSignMessage(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        # derive once the addresses of the wifs used by more than one test:
+        # each derivation requires a scalar multiplication
+        wifs = ('L4xAvhKR35zFcamyHME2ZHfhw5DEyeJvEMovQHQ7DttPTM8NLWCK',)
+        cls.addrs = {
+            wif: (p2pkh_from_wif(wif),
+                  p2wpkh_from_wif(wif),
+                  p2wpkh_p2sh_from_wif(wif))
+            for wif in wifs
+        }
+
+        # python-bitcoinlib test vectors, with deserialized signatures
+        file = "btcmsg.json"
+        filename = path.join(path.dirname(__file__), "data", file)
+        with open(filename, 'r') as f:
+            test_vectors = json.load(f)
+        cls.vectors = [(vector, btcmsg.deserialize(vector['signature']))
+                       for vector in test_vectors[:5]]
+
     def test_msgsign_p2pkh(self):
         msg = 'test message'
         # sigs are taken from (Electrum and) Bitcoin Core
@@ -76,6 +97,9 @@ class TestSignMessage(unittest.TestCase):
         sig = btcmsg.sign(msg.encode(), wif)
         self.assertTrue(btcmsg.verify(msg.encode(), address, sig))
         self.assertEqual(btcmsg.serialize(*sig), exp_sig)
+        sig = btcmsg.sign(bytearray(msg.encode()), wif)
+        self.assertTrue(btcmsg.verify(bytearray(msg.encode()), address, sig))
+        self.assertEqual(btcmsg.serialize(*sig), exp_sig)
 
         wif = '5JDopdKaxz5bXVYXcAnfno6oeSL8dpipxtU1AhfKe3Z58X48srn'
         # uncompressed
@@ -157,9 +181,7 @@ class TestSignMessage(unittest.TestCase):
 
         msg = 'test'
         wif = 'L4xAvhKR35zFcamyHME2ZHfhw5DEyeJvEMovQHQ7DttPTM8NLWCK'
-        p2pkh = p2pkh_from_wif(wif)
-        p2wpkh = p2wpkh_from_wif(wif)
-        p2wpkh_p2sh = p2wpkh_p2sh_from_wif(wif)
+        p2pkh, p2wpkh, p2wpkh_p2sh = self.addrs[wif]
 
         # p2pkh base58 address (Core, Electrum, BIP137)
         exp_sig = b'IBFyn+h9m3pWYbB4fBFKlRzBD4eJKojgCIZSNdhLKKHPSV2/WkeV7R7IOI0dpo3uGAEpCz9eepXLrA5kF35MXuU='
@@ -249,6 +271,28 @@ class TestSignMessage(unittest.TestCase):
         self.assertTrue(btcmsg.verify(msg, address, sig))
         self.assertEqual(btcmsg.serialize(*sig), exp_sig)
 
+    def test_sign_long_message(self):
+
+        wif = 'Ky1XfDK2v6wHPazA6ECaD8UctEoShXdchgABjpU9GWGZDxVRDBMJ'
+        address = '1DAag8qiPLHh6hMFVu9qJQm9ro1HtwuyK5'
+
+        # message length is a compact-size varint, as in Bitcoin Core
+        prefix = b'\x18Bitcoin Signed Message:\n'
+        msg = b'a' * 252
+        exp_hash = sha256(prefix + b'\xfc' + msg)
+        self.assertEqual(btcmsg._magic_hash(msg), exp_hash)
+        msg = b'a' * 253
+        exp_hash = sha256(prefix + b'\xfd\xfd\x00' + msg)
+        self.assertEqual(btcmsg._magic_hash(msg), exp_hash)
+        msg = b'a' * 300
+        exp_hash = sha256(prefix + b'\xfd\x2c\x01' + msg)
+        self.assertEqual(btcmsg._magic_hash(msg), exp_hash)
+
+        msg = 'a' * 300
+        sig = btcmsg.sign(msg, wif)
+        self.assertTrue(btcmsg.verify(msg, address, sig))
+        self.assertFalse(btcmsg.verify(msg[:44], address, sig))
+
     def test_exceptions(self):
 
         msg = 'test'
@@ -293,9 +337,7 @@ class TestSignMessage(unittest.TestCase):
 
         msg = 'test'
         wif = 'L4xAvhKR35zFcamyHME2ZHfhw5DEyeJvEMovQHQ7DttPTM8NLWCK'
-        p2pkh = p2pkh_from_wif(wif)
-        p2wpkh = p2wpkh_from_wif(wif)
-        p2wpkh_p2sh = p2wpkh_p2sh_from_wif(wif)
+        p2pkh, p2wpkh, p2wpkh_p2sh = self.addrs[wif]
         wif = 'Ky1XfDK2v6wHPazA6ECaD8UctEoShXdchgABjpU9GWGZDxVRDBMJ'
         # Mismatch between p2pkh address and key pair
         self.assertRaises(ValueError, btcmsg.sign, msg, wif, p2pkh)
@@ -329,12 +371,7 @@ class TestSignMessage(unittest.TestCase):
         https://github.com/petertodd/python-bitcoinlib/blob/master/bitcoin/tests/data/btcmsg.json
         """
 
-        file = "btcmsg.json"
-        filename = path.join(path.dirname(__file__), "data", file)
-        with open(filename, 'r') as f:
-            test_vectors = json.load(f)
-
-        for vector in test_vectors[:5]:
+        for vector, sig0 in self.vectors:
             msg = vector['address']
             tuplesig = btcmsg.sign(msg, vector['wif'])
             self.assertTrue(btcmsg.verify(msg, vector['address'], tuplesig))
@@ -349,7 +386,7 @@ class TestSignMessage(unittest.TestCase):
             # python-bitcoinlib does not use RFC6979 deterministic nonce
             # as proved by different r compared to Core/Electrum/btclib
             rf, r, s = tuplesig
-            rf0, r0, s0 = btcmsg.deserialize(vector['signature'])
+            rf0, r0, s0 = sig0
             self.assertNotEqual(r, r0)
 
             # while Core/Electrum/btclib use 'low-s' canonical signature
@@ -29,10 +29,18 @@ class TestEllipticCurve(unittest.TestCase):
                 Qjac = _mult_jac(q, ec.GJ, ec)
                 Q2 = ec._aff_from_jac(Qjac)
                 self.assertEqual(Q, Q2)
+                Q3 = ec._aff_from_jac(ec._mult_G(q))
+                self.assertEqual(Q, Q3)
         # with last curve
         self.assertEqual(INF, ec._mult_aff(3, INF))
         self.assertEqual(INFJ, _mult_jac(3, INFJ, ec))
 
+        ec = secp256k1
+        for _ in range(20):
+            q = random.getrandbits(ec.nlen)
+            Q = ec._aff_from_jac(_mult_jac(q, ec.GJ, ec))
+            self.assertEqual(Q, ec._aff_from_jac(ec._mult_G(q)))
+
     def test_shamir(self):
         ec = ec23_31
         for k1 in range(ec.n):
@@ -47,6 +55,18 @@ class TestEllipticCurve(unittest.TestCase):
                 std = ec.add(mult(k1, ec.G, ec), mult(k2, INF, ec))
                 self.assertEqual(shamir, std)
 
+        ec = secp256k1
+        Q = mult(random.getrandbits(ec.nlen), ec.G, ec)
+        for _ in range(10):
+            k1 = random.getrandbits(ec.nlen)
+            k2 = random.getrandbits(ec.nlen)
+            shamir = double_mult(k1, ec.G, k2, Q, ec)
+            std = ec.add(mult(k1, ec.G, ec), mult(k2, Q, ec))
+            self.assertEqual(shamir, std)
+        # H = -Q
+        shamir = double_mult(k1, ec.opposite(Q), k2, Q, ec)
+        self.assertEqual(shamir, mult(k2 - k1, Q, ec))
+
     def test_boscoster(self):
         ec = secp256k1
 
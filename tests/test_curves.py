@@ -102,6 +102,10 @@ class TestEllipticCurve(unittest.TestCase):
         self.assertRaises(ValueError, secp256k1.y, secp256k1._p)
         # secp256k1.y(secp256k1._p)
 
+        # x-coordinate not on the curve: y^2 = x^3 + 7 has no root for x = 5
+        self.assertRaises(ValueError, secp256k1.y, 5)
+        # secp256k1.y(5)
+
     def test_all_curves(self):
         for ec in all_curves:
             self.assertEqual(ec.mult(0), INF)
@@ -321,6 +325,8 @@ class TestEllipticCurve(unittest.TestCase):
             Q3 = ec._add_aff(Q1,  ec.G)
             Q3jac = ec._add_jac(Q1J, ec.GJ)
             self.assertEqual(Q3, ec._aff_from_jac(Q3jac))
+            Q3jac = ec._add_jac_aff(Q1J, ec.G)
+            self.assertEqual(Q3, ec._aff_from_jac(Q3jac))
 
             # point at infinity
             Q3 = ec._add_aff(ec.G,  INF)
@@ -329,17 +335,27 @@ class TestEllipticCurve(unittest.TestCase):
             Q3 = ec._add_aff(INF,  ec.G)
             Q3jac = ec._add_jac(INFJ, ec.GJ)
             self.assertEqual(Q3, ec._aff_from_jac(Q3jac))
+            Q3jac = ec._add_jac_aff(ec.GJ, INF)
+            self.assertEqual(ec.G, ec._aff_from_jac(Q3jac))
+            Q3jac = ec._add_jac_aff(INFJ, ec.G)
+            self.assertEqual(ec.G, ec._aff_from_jac(Q3jac))
 
             # point doubling
             Q3 = ec._add_aff(Q1,  Q1)
+            self.assertEqual(Q3, ec._dbl_aff(Q1))
+            self.assertEqual(INF, ec._dbl_aff(INF))
             Q3jac = ec._add_jac(Q1J, Q1J)
             self.assertEqual(Q3, ec._aff_from_jac(Q3jac))
+            Q3jac = ec._add_jac_aff(Q1J, Q1)
+            self.assertEqual(Q3, ec._aff_from_jac(Q3jac))
 
             # opposite points
             Q1opp = ec.opposite(Q1)
             Q3 = ec._add_aff(Q1,  Q1opp)
             Q3jac = ec._add_jac(Q1J, _jac_from_aff(Q1opp))
             self.assertEqual(Q3, ec._aff_from_jac(Q3jac))
+            Q3jac = ec._add_jac_aff(Q1J, Q1opp)
+            self.assertEqual(Q3, ec._aff_from_jac(Q3jac))
 
 
 if __name__ == "__main__":
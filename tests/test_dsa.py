@@ -190,6 +190,53 @@ class TestDSA(unittest.TestCase):
         for Q in keys:
             self.assertTrue(dsa.verify(msg, Q, sig, ec))
 
+        # key_id = 2*j + odd, where K_x = r + j*n
+        c = dsa._challenge(msg, ec, hf)
+        recovered = []
+        for key_id in range(2*ec.h):
+            try:
+                QJ = dsa._recover_pubkey(key_id, c, r, s, ec)
+            except Exception:  # invalid K or Q for this key_id
+                continue
+            recovered.append(ec._aff_from_jac(QJ))
+        self.assertEqual(recovered, keys)
+
+    def test_batch_verify(self):
+        ms = []
+        Qs = []
+        sigs = []
+        for q in (0x1, 0x10, 0xDEADBEEF, ec.n - 1):
+            msg = f'Satoshi Nakamoto {q}'
+            ms.append(msg)
+            Qs.append(mult(q))
+            sigs.append(dsa.sign(msg, q))
+        # test with only 1 sig
+        dsa._batch_verify(ms[:1], Qs[:1], sigs[:1], ec, hf)
+        dsa._batch_verify(ms, Qs, sigs, ec, hf)
+        self.assertTrue(dsa.batch_verify(ms, Qs, sigs))
+
+        # invalid sig
+        ms.append(ms[0])
+        Qs.append(Qs[0])
+        sigs.append(sigs[1])
+        self.assertFalse(dsa.batch_verify(ms, Qs, sigs))
+        self.assertRaises(AssertionError, dsa._batch_verify, ms, Qs, sigs, ec, hf)
+        #dsa._batch_verify(ms, Qs, sigs, ec, hf)
+        sigs[-1] = sigs[0]  # valid again
+        self.assertTrue(dsa.batch_verify(ms, Qs, sigs))
+
+        # mismatch between number of pubkeys (5) and number of messages (6)
+        ms.append(ms[0])  # add extra message
+        self.assertRaises(ValueError, dsa._batch_verify, ms, Qs, sigs, ec, hf)
+        #dsa._batch_verify(ms, Qs, sigs, ec, hf)
+        ms.pop()  # valid again
+
+        # mismatch between number of pubkeys (5) and number of signatures (6)
+        sigs.append(sigs[0])  # add extra sig
+        self.assertRaises(ValueError, dsa._batch_verify, ms, Qs, sigs, ec, hf)
+        #dsa._batch_verify(ms, Qs, sigs, ec, hf)
+        sigs.pop()  # valid again
+
     def test_crack_prvkey(self):
         q = 0xDEADBEEF6A307F426A94F8114701E7C8E774E7F9A47E2C2035DB29A206321725
         k = 1010101010101010101
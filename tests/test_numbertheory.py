@@ -10,7 +10,7 @@
 
 import unittest
 
-from btclib.numbertheory import mod_inv, mod_sqrt
+from btclib.numbertheory import mod_inv, mod_inv_batch, mod_sqrt
 
 primes = [2,    3,   5,   7,  11,  13,   17,  19,  23, 29,
           31,  37,  41,  43,  47,  53,   59,  61,  67, 71,
@@ -51,6 +51,16 @@ class TestNumberTheory(unittest.TestCase):
                 else:
                     self.assertRaises(ValueError, mod_inv, a, m)
 
+    def test_mod_inv_batch(self):
+        for p in primes:
+            a = list(range(1, min(p, 50)))
+            inv = mod_inv_batch(a, p)
+            self.assertEqual(inv, [mod_inv(ai, p) for ai in a])
+            # zero has no inverse
+            self.assertRaises(ValueError, mod_inv_batch, a + [0], p)
+        self.assertEqual(mod_inv_batch([], 7), [])
+        self.assertEqual(mod_inv_batch([3], 7), [5])
+
     def test_mod_sqrt(self):
         for p in primes[:30]:  # exhaustable only for small p
             hasRoot = set()
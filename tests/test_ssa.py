@@ -397,6 +397,14 @@ class TestEcssa(unittest.TestCase):
             A.append(ec.add(A1[i], ec.add(A2[i], A3[i])))
 
         Q = A[0]  # aggregated public key
+        # public keys have square y: if Q has not,
+        # -Q is used and the shares of the secret key are negated too
+        if not ec.has_square_y(Q):
+            Q = ec.opposite(Q)
+            A = [ec.opposite(P) for P in A]
+            alpha1 = ec.n - alpha1
+            alpha2 = ec.n - alpha2
+            alpha3 = ec.n - alpha3
 
         ### SECOND PHASE: generation of the nonces' pair ###
         # This phase follows exactly the key generation procedure
@@ -556,7 +564,10 @@ class TestEcssa(unittest.TestCase):
 
         ### ADDITIONAL PHASE: reconstruction of the private key ###
         secret = (omega1 * alpha1 + omega3 * alpha3) % ec.n
-        self.assertEqual((q1 + q2 + q3) % ec.n, secret)
+        q = (q1 + q2 + q3) % ec.n
+        if not ec.has_square_y(mult(q)):
+            q = ec.n - q
+        self.assertEqual(q, secret)
 
     def test_musig(self):
         """testing 3-of-3 MuSig